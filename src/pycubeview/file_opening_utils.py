@@ -18,12 +18,16 @@ Available Helper Functions::
 """
 
 # Built-Ins
+import mmap
+import os
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, TextIO
 from dataclasses import dataclass
+import warnings
 
 # Dependencies
 import numpy as np
+import numpy.typing as npt
 import rasterio as rio  # type: ignore
 import spectralio as sio
 import re
@@ -32,13 +36,27 @@ import pandas as pd
 
 # ---- Handling Wavelength Data Files ----
 
+# Matches every `name = value` or (possibly multi-line) `name = {...}` field
+# of an ENVI header, so that a header is scanned only once.
+_ENVI_FIELD_PATTERN = (
+    r"^[ \t]*(?P<name>\w[\w ]*?)[ \t]*=[ \t]*"
+    r"(?:\{(?P<list>[^}]*)\}|(?P<scalar>[^\n{]*?))[ \t]*\r?$"
+)
+_ENVI_FIELD_RE = re.compile(_ENVI_FIELD_PATTERN, re.MULTILINE)
+# Same pattern for searching a memory-mapped header.
+_ENVI_FIELD_RE_BYTES = re.compile(
+    _ENVI_FIELD_PATTERN.encode("ascii"), re.MULTILINE
+)
+
 
 class WvlHandler(Protocol):
     """
     Protocol for handling wavelength (or other context data) files.
     """
 
-    def __call__(self, path: Path) -> np.ndarray: ...
+    def __call__(
+        self, path: Path, dtype: npt.DTypeLike = np.float64
+    ) -> np.ndarray: ...
 
     """
     Handle a file at the given path.
@@ -52,6 +70,8 @@ class WvlHandler(Protocol):
         - .hdr
         - .txt
         - .csv
+    dtype: DTypeLike, optional
+        Floating point type of the returned array. Default is float64.
 
     Returns
     -------
@@ -65,45 +85,132 @@ class WvlHandler(Protocol):
     """
 
 
-def open_wvl_file(path: Path) -> np.ndarray:
+def open_wvl_file(path: Path, dtype: npt.DTypeLike = np.float64) -> np.ndarray:
     """Reads .wvl files using `spectralio`"""
     wvl = sio.read_wvl(path)
-    return wvl.asarray()
+    return wvl.asarray().astype(dtype, copy=False)
 
 
-def open_hdr_file(path: Path) -> np.ndarray:
-    """Read an ENVI .hdr file"""
-    wvl_pattern = re.compile(r"wavelength\s=\s\{([^}]*)\}")
+def _read_text(path: Path | TextIO) -> str:
+    """
+    Returns the full text of `path`, which may be a path or an already open
+    file-like object (anything with a `.read` method).
+    """
+    if hasattr(path, "read"):
+        return path.read()
     with open(path, "r") as f:
-        file_contents = f.read()
-    result = re.findall(wvl_pattern, file_contents)
-    if len(result) == 0:
-        raise OSError("Unable to open .hdr file. Is there a wavelength field?")
-    vals = np.asarray([float(i) for i in result[0].split(",")])
+        return f.read()
+
+
+def _parse_wvl_values(
+    text: str, dtype: npt.DTypeLike = np.float64
+) -> np.ndarray:
+    """
+    Parses a comma-separated string of wavelength values with NumPy's C
+    parser.
+
+    Raises
+    ------
+    ValueError
+        If the string is empty or holds a non-numeric value.
+    """
+    text = text.strip().rstrip(",")
+    with warnings.catch_warnings():
+        # NumPy only warns (and truncates) on unparseable tokens.
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            vals = np.fromstring(text, dtype=dtype, sep=",")
+        except DeprecationWarning as e:
+            raise ValueError(f"Invalid wavelength values: {e}") from e
+    if vals.size == 0:
+        raise ValueError("No wavelength values were found.")
     return vals
 
 
-def open_txt_file(path: Path) -> np.ndarray:
+def _read_envi_fields(path: Path | TextIO) -> dict[str, str]:
     """
-    Read a .txt file. Wavelength values should be seperated by commas.
+    Reads every field of an ENVI header in a single pass.
+
+    Headers on disk are memory-mapped and only the field names and values are
+    decoded; empty or non-regular files fall back to a plain text read.
+
+    Returns
+    -------
+    fields: dict[str, str]
+        Maps lowercase field names (e.g. "wavelength", "bands") to their raw
+        value, without the braces for list fields. If a field is repeated,
+        the first one is kept.
     """
-    with open(path, "r") as f:
-        contents = f.read()
-    vals = contents.split(",")
-    if vals[-1] == " ":
-        vals = vals[:-1]
-    return np.asarray([float(i) for i in vals])
+    fields: dict[str, str] = {}
+    if not hasattr(path, "read"):
+        try:
+            with (
+                open(path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                for bmatch in _ENVI_FIELD_RE_BYTES.finditer(mm):
+                    name = bmatch["name"].decode("latin-1").strip().lower()
+                    value = bmatch["list"]
+                    if value is None:
+                        value = bmatch["scalar"]
+                    fields.setdefault(name, value.decode("latin-1"))
+            return fields
+        except (ValueError, OSError):
+            pass
+    for match in _ENVI_FIELD_RE.finditer(_read_text(path)):
+        name = match["name"].strip().lower()
+        value = match["list"]
+        if value is None:
+            value = match["scalar"]
+        fields.setdefault(name, value)
+    return fields
+
+
+def open_hdr_file(
+    path: Path | TextIO, dtype: npt.DTypeLike = np.float64
+) -> np.ndarray:
+    """Read an ENVI .hdr file"""
+    fields = _read_envi_fields(path)
+    if "wavelength" not in fields:
+        raise OSError("Unable to open .hdr file. Is there a wavelength field?")
+    return _parse_wvl_values(fields["wavelength"], dtype)
 
 
-def open_csv_file(path: Path) -> np.ndarray:
+def open_txt_file(
+    path: Path | TextIO, dtype: npt.DTypeLike = np.float64
+) -> np.ndarray:
+    """
+    Read a .txt file. Wavelength values should be seperated by commas.
+    """
+    # Values may wrap across lines, each ending in a comma, so rejoin them
+    # into a single comma-separated line before parsing.
+    lines = _read_text(path).splitlines()
+    text = ",".join(
+        line.strip().rstrip(",") for line in lines if line.strip(", \t")
+    )
+    if text == "":
+        raise ValueError("No wavelength values were found.")
+    # Handing loadtxt the already-read line keeps the parsing in NumPy's C
+    # reader; it raises ValueError on any non-numeric value.
+    return np.loadtxt([text], delimiter=",", dtype=dtype, ndmin=1)
+
+
+def open_csv_file(
+    path: Path | TextIO, dtype: npt.DTypeLike = np.float64
+) -> np.ndarray:
     """
     Opens a csv file where there is one row of headers and at least one is
     "wavelength". Make sure there are no spaces around the commas!
     """
-    df = pd.read_csv(path)
-    wvl_col_idx = [i.lower() for i in df.columns.to_list()].index("wavelength")
-    wvl = df.iloc[:, wvl_col_idx].to_numpy()
-    return wvl
+    # Only the wavelength column is tokenized into a DataFrame.
+    df = pd.read_csv(
+        path,
+        usecols=lambda col: str(col).lower() == "wavelength",
+        engine="c",
+    )
+    if df.shape[1] == 0:
+        raise ValueError("Unable to open .csv file. No wavelength column.")
+    return df.iloc[:, 0].to_numpy(dtype=dtype)
 
 
 # Mapping from lowercase string file extensions to handler functions.
@@ -114,18 +221,29 @@ WVL_HANDLERS: dict[str, WvlHandler] = {
     ".csv": open_csv_file,
 }
 
+# Parsed wavelength arrays keyed by (real path, dtype). Each entry stores the
+# (mtime, size) of the file when it was parsed so that edits invalidate it.
+_WVL_CACHE: dict[tuple[str, str], tuple[tuple[int, int], np.ndarray]] = {}
 
-def open_wvl(path: str | Path) -> np.ndarray:
+
+def open_wvl(
+    path: str | Path, dtype: npt.DTypeLike = np.float64
+) -> np.ndarray:
     """
     Open a file that stores wavelength information.
 
     This function inspects the files extension name and passes it to the
-    appropriate handler for that file type.
+    appropriate handler for that file type. Parsed arrays are cached until
+    the file is modified, so reopening a shared wavelength file is cheap.
 
     Parameters
     ----------
     path: str or Path
         Path to file containing wavelength data that is to be opened.
+    dtype: DTypeLike, optional
+        Floating point type of the returned array. Default is float64.
+        float32 is ample for instrument wavelength precision and halves the
+        memory of arrays with many bands.
 
     Raises
     ------
@@ -134,18 +252,28 @@ def open_wvl(path: str | Path) -> np.ndarray:
     ValueError
         If the file does not have a valid extension.
     """
-    path = Path(path)
-    if not path.exists():
+    path_str = os.fspath(path)
+    try:
+        stat = os.stat(path_str)
+    except OSError:
         raise FileNotFoundError(path)
 
-    suffix = path.suffix.lower()
+    suffix = os.path.splitext(path_str)[1].lower()
 
     handler = WVL_HANDLERS.get(suffix)
 
     if handler is None:
         raise ValueError(f"Unsupported file type: {suffix}")
 
-    return handler(path)
+    key = (os.path.realpath(path_str), np.dtype(dtype).str)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _WVL_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, handler(Path(path_str), dtype))
+        _WVL_CACHE[key] = cached
+
+    # Copy so that callers can't modify the cached array.
+    return cached[1].copy()
 
 
 # ---- Handling Cube Data Files ----
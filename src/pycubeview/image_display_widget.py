@@ -236,10 +236,8 @@ class ImagePickerWidget(QWidget):
         end_pt2 = self.imview.getView().mapSceneToView(end_pt2)
         pt1_int: tuple[int, int] = (int(end_pt1.x()), int(end_pt1.y()))
         pt2_int: tuple[int, int] = (int(end_pt2.x()), int(end_pt2.y()))
-        pixels = get_bresenham_line(pt1_int, pt2_int)
-        coords = np.empty((len(pixels), 2), dtype=np.int32)
-        for n, i in enumerate(pixels):
-            coords[n, :] = i
+        xs, ys = get_bresenham_line(pt1_int, pt2_int)
+        coords = np.stack([xs, ys], axis=1)
         self.line_roi_updated.emit(coords)
 
     def close_line_roi(self) -> None:
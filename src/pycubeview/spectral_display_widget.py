@@ -16,6 +16,7 @@ from spectralio.geospatial_models import PointModel
 # Local Imports
 from .spectrum_edit_window import SpectrumEditWindow
 from .valid_colormaps import SequentialColorMap
+from .utils import spectra_mean_std
 
 
 class SpectralDisplayWidget(QWidget):
@@ -151,8 +152,7 @@ class SpectralDisplayWidget(QWidget):
             raise ValueError("Group Coordinate Array is the wrong size")
 
         spec_array = self.cube[coords[:, 1], coords[:, 0], :]
-        mean_spectrum = np.mean(spec_array, axis=0)
-        err_spectrum = np.std(spec_array, axis=0, ddof=1)
+        mean_spectrum, err_spectrum = spectra_mean_std(spec_array)
         spec_name = f"SPECTRUM_{self._count:02d}"
         spec_item = pg.PlotDataItem(
             self.wvl,
@@ -1,6 +1,12 @@
+# Dependencies
+import numpy as np
+from numba import njit, prange  # type: ignore
+
+
+@njit(cache=True)
 def _low_bresenham_line(
     pt1: tuple[int, int], pt2: tuple[int, int]
-) -> list[tuple[int, int]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Implements Bresenham Algorithm to rasterize a line for slopes from -0.5 to
     0.5.
@@ -14,8 +20,10 @@ def _low_bresenham_line(
 
     Returns
     -------
-    pt_list: list[tuple[int, int]]
-        All the pixels that intersect the line.
+    xs: np.ndarray
+        int32 x coordinates of all the pixels that intersect the line.
+    ys: np.ndarray
+        int32 y coordinates of all the pixels that intersect the line.
     """
 
     dx = pt2[0] - pt1[0]
@@ -35,32 +43,29 @@ def _low_bresenham_line(
 
     diff = (2 * dy) - dx
 
-    pixels: list[tuple[int, int]] = []
+    # x advances by one pixel every step, so the length is known up front.
+    n = dx + 1
+    xs = np.empty(n, dtype=np.int32)
+    ys = np.empty(n, dtype=np.int32)
 
     x, y = pt1
-    n = 0
-    while True:
-        n += 1
-
-        pixels.append((x, y))
-
-        if x == pt2[0] and y == pt2[1]:
-            break
+    for i in range(n):
+        xs[i] = x
+        ys[i] = y
 
+        # Branchless form of `if diff > 0: y += y_change; diff -= 2 * dx`.
+        step = np.int32(diff > 0)
         x += x_change
+        y += y_change * step
+        diff += 2 * dy - 2 * dx * step
 
-        if diff > 0:
-            y += y_change
-            diff += 2 * (dy - dx)
-        else:
-            diff += 2 * dy
-
-    return pixels
+    return xs, ys
 
 
+@njit(cache=True)
 def _high_bresenham_line(
     pt1: tuple[int, int], pt2: tuple[int, int]
-) -> list[tuple[int, int]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Implements Bresenham Algorithm to rasterize a line for slopes < -0.5 or >
     0.5.
@@ -74,23 +79,22 @@ def _high_bresenham_line(
 
     Returns
     -------
-    pt_list: list[tuple[int, int]]
-        All the pixels that intersect the line.
+    xs: np.ndarray
+        int32 x coordinates of all the pixels that intersect the line.
+    ys: np.ndarray
+        int32 y coordinates of all the pixels that intersect the line.
     """
 
     dx = pt2[0] - pt1[0]
     dy = pt2[1] - pt1[1]
 
     if dx < 0:
-        # print("Negative High Slope")
         x_change = -1
         dx *= -1
     else:
-        # print("Positive High Slope")
         x_change = 1
 
     if dy < 0:
-        # print("Negative Y Change")
         y_change = -1
         dy *= -1
     else:
@@ -98,33 +102,164 @@ def _high_bresenham_line(
 
     diff = (2 * dx) - dy
 
-    pixels: list[tuple[int, int]] = []
+    # y advances by one pixel every step, so the length is known up front.
+    n = dy + 1
+    xs = np.empty(n, dtype=np.int32)
+    ys = np.empty(n, dtype=np.int32)
 
     x, y = pt1
-    n = 0
-    while True:
-        n += 1
-
-        pixels.append((x, y))
-
-        if x == pt2[0] and y == pt2[1]:
-            break
+    for i in range(n):
+        xs[i] = x
+        ys[i] = y
 
+        # Branchless form of `if diff > 0: x += x_change; diff -= 2 * dy`.
+        step = np.int32(diff > 0)
         y += y_change
+        x += x_change * step
+        diff += 2 * dx - 2 * dy * step
 
-        if diff > 0:
-            x += x_change
-            diff += 2 * (dx - dy)
-        else:
-            diff += 2 * dx
-
-    return pixels
+    return xs, ys
 
 
 def get_bresenham_line(
     pt1: tuple[int, int], pt2: tuple[int, int]
-) -> list[tuple[int, int]]:
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterizes the line from `pt1` to `pt2`.
+
+    The pixels are returned as separate x and y arrays so that they can index
+    an image directly, e.g. `cube[ys, xs, :]`.
+
+    Parameters
+    ----------
+    pt1: tuple[int, int]
+        Starting point for the line.
+    pt2: tuple[int, int]
+        Ending point for the line.
+
+    Returns
+    -------
+    xs: np.ndarray
+        int32 x coordinates of all the pixels that intersect the line.
+    ys: np.ndarray
+        int32 y coordinates of all the pixels that intersect the line.
+    """
     if abs(pt2[1] - pt1[1]) < abs(pt2[0] - pt1[0]):
         return _low_bresenham_line(pt1, pt2)
     else:
         return _high_bresenham_line(pt1, pt2)
+
+
+def get_bresenham_line_tuples(
+    pt1: tuple[int, int], pt2: tuple[int, int]
+) -> list[tuple[int, int]]:
+    """
+    Same as `get_bresenham_line`, but returns a list of (x, y) tuples.
+    """
+    xs, ys = get_bresenham_line(pt1, pt2)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+@njit(parallel=True, cache=True)
+def get_bresenham_lines(segs: np.ndarray) -> np.ndarray:
+    """
+    Rasterizes many line segments at once, e.g. the edges of a polyline.
+
+    Segments are rasterized in parallel. Shared endpoints of consecutive
+    segments are repeated in the output.
+
+    Parameters
+    ----------
+    segs: np.ndarray
+        (N, 2, 2) integer array where `segs[i, 0]` is the (x, y) start and
+        `segs[i, 1]` is the (x, y) end of segment `i`.
+
+    Returns
+    -------
+    pixels: np.ndarray
+        (M, 2) int32 array of x, y pixels for every segment, in order.
+    """
+    nsegs = segs.shape[0]
+
+    # First pass: the pixel count of each segment.
+    lens = np.empty(nsegs, dtype=np.int64)
+    for i in prange(nsegs):
+        dx = abs(segs[i, 1, 0] - segs[i, 0, 0])
+        dy = abs(segs[i, 1, 1] - segs[i, 0, 1])
+        lens[i] = max(dx, dy) + 1
+    offsets = np.cumsum(lens)
+
+    # Second pass: each segment writes into its own slice of the output.
+    pixels = np.empty((offsets[-1] if nsegs > 0 else 0, 2), dtype=np.int32)
+    for i in prange(nsegs):
+        pt1 = (segs[i, 0, 0], segs[i, 0, 1])
+        pt2 = (segs[i, 1, 0], segs[i, 1, 1])
+        if abs(pt2[1] - pt1[1]) < abs(pt2[0] - pt1[0]):
+            xs, ys = _low_bresenham_line(pt1, pt2)
+        else:
+            xs, ys = _high_bresenham_line(pt1, pt2)
+        stop = offsets[i]
+        pixels[stop - lens[i]:stop, 0] = xs
+        pixels[stop - lens[i]:stop, 1] = ys
+
+    return pixels
+
+
+# fastmath without the no-NaN/no-inf assumptions, since cubes commonly use
+# NaN for missing data and those must still propagate into the statistics.
+_REDUCTION_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def spectra_mean_std(spectra: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-band mean and sample standard deviation (ddof=1) of a group of
+    spectra, e.g. the pixels of a group ROI.
+
+    Parameters
+    ----------
+    spectra: np.ndarray
+        (N, bands) array with one spectrum per row.
+
+    Returns
+    -------
+    mean: np.ndarray
+        Mean spectrum. float32 and float64 input keep their dtype, any other
+        dtype (e.g. an integer cube) gives float64.
+    std: np.ndarray
+        Standard deviation spectrum, with the same dtype as `mean`. All NaN
+        if there are fewer than two spectra.
+    """
+    if spectra.dtype in (np.float32, np.float64):
+        out_dtype = spectra.dtype
+    else:
+        out_dtype = np.dtype(np.float64)
+    return _spectra_mean_std(spectra.astype(out_dtype, copy=False))
+
+
+@njit(fastmath=_REDUCTION_FASTMATH, boundscheck=False, cache=True)
+def _spectra_mean_std(spectra: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numba kernel for `spectra_mean_std`. `spectra` must be float32 or
+    float64; the results have the same dtype.
+    """
+    n, nbands = spectra.shape
+
+    # Accumulate in float64, looping over the contiguous band axis innermost
+    # so that the reductions vectorize.
+    total = np.zeros(nbands, dtype=np.float64)
+    for i in range(n):
+        for b in range(nbands):
+            total[b] += spectra[i, b]
+    mean = total / n
+
+    sq_dev = np.zeros(nbands, dtype=np.float64)
+    for i in range(n):
+        for b in range(nbands):
+            d = spectra[i, b] - mean[b]
+            sq_dev[b] += d * d
+    if n > 1:
+        std = np.sqrt(sq_dev / (n - 1))
+    else:
+        std = np.full(nbands, np.nan)
+
+    return mean.astype(spectra.dtype), std.astype(spectra.dtype)
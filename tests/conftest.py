@@ -0,0 +1,110 @@
+"""Shared pytest fixtures for the pycubeview test suite."""
+
+import asyncio
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pycubeview.file_opening_utils import (
+    open_txt_file,
+    open_csv_file,
+    open_hdr_file,
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--async-fixtures",
+        action="store_true",
+        default=False,
+        help=(
+            "Write every `wvl_file` of the session concurrently up front, "
+            "instead of one at a time as each test starts."
+        ),
+    )
+
+
+async def _write_files(files: dict[Path, str]) -> None:
+    """Writes every file concurrently on the default thread pool."""
+    await asyncio.gather(
+        *(asyncio.to_thread(p.write_text, c) for p, c in files.items())
+    )
+
+
+@pytest.fixture(scope="session")
+def _prewritten_wvl_files(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> dict[str, Path]:
+    """
+    With `--async-fixtures`, writes the `wvl_file` parameter of every
+    collected test at once and maps each test's node id to its file.
+    Without the flag this is empty.
+    """
+    if not request.config.getoption("--async-fixtures"):
+        return {}
+
+    root = tmp_path_factory.mktemp("wvl_files")
+    paths: dict[str, Path] = {}
+    files: dict[Path, str] = {}
+    for i, item in enumerate(request.session.items):
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "wvl_file" not in callspec.params:
+            continue
+        suffix, content = callspec.params["wvl_file"]
+        paths[item.nodeid] = root / f"{i}{suffix}"
+        files[paths[item.nodeid]] = content
+    asyncio.run(_write_files(files))
+    return paths
+
+
+@pytest.fixture
+def wvl_file(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    _prewritten_wvl_files: dict[str, Path],
+) -> Path:
+    """
+    A real wavelength file on disk, from an indirect `(suffix, content)`
+    parameter of `@pytest.mark.parametrize("wvl_file", ..., indirect=True)`.
+    """
+    path = _prewritten_wvl_files.get(request.node.nodeid)
+    if path is None:
+        suffix, content = request.param
+        path = tmp_path / f"wvl{suffix}"
+        path.write_text(content)
+    return path
+
+
+@pytest.fixture(scope="session")
+def basic_txt_array() -> np.ndarray:
+    """Wavelengths parsed once from a basic comma-separated .txt file."""
+    return open_txt_file(io.StringIO("400.0,450.5,500.0,550.5,600.0"))
+
+
+@pytest.fixture(scope="session")
+def basic_csv_array() -> np.ndarray:
+    """Wavelengths parsed once from a basic .csv file."""
+    return open_csv_file(
+        io.StringIO(
+            "wavelength,intensity\n"
+            "400.0,100\n"
+            "450.5,150\n"
+            "500.0,200\n"
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def basic_hdr_array() -> np.ndarray:
+    """Wavelengths parsed once from a basic ENVI .hdr file."""
+    return open_hdr_file(
+        io.StringIO(
+            "ENVI\n"
+            "samples = 100\n"
+            "lines = 50\n"
+            "bands = 5\n"
+            "wavelength = {400.0, 450.0, 500.0, 550.0, 600.0}\n"
+        )
+    )
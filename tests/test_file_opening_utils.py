@@ -1,439 +1,381 @@
 """Unit tests for pycubeview.file_opening_utils module."""
 
+import io
+import os
 import unittest
-import tempfile
 from pathlib import Path
 import numpy as np
+import pytest
 
 from pycubeview.file_opening_utils import (
     open_txt_file,
     open_csv_file,
     open_hdr_file,
     open_wvl,
+    _read_envi_fields,
 )
 
 
 class TestOpenTxtFile(unittest.TestCase):
     """Test cases for open_txt_file function."""
 
-    def test_open_txt_file_basic(self):
-        """Test opening a basic txt file with comma-separated wavelengths."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("400.0,450.5,500.0,550.5,600.0")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_txt_file(temp_path)
-            expected = np.array([400.0, 450.5, 500.0, 550.5, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
     def test_open_txt_file_single_value(self):
         """Test txt file with single wavelength value."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("550.0")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_txt_file(temp_path)
-            self.assertEqual(len(result), 1)
-            self.assertAlmostEqual(result[0], 550.0)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO("550.0")
+        result = open_txt_file(f)
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0], 550.0)
 
     def test_open_txt_file_with_trailing_space(self):
         """Test txt file with trailing space after last value."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("400.0,500.0,600.0 ")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_txt_file(temp_path)
-            expected = np.array([400.0, 500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO("400.0,500.0,600.0 ")
+        result = open_txt_file(f)
+        expected = np.array([400.0, 500.0, 600.0])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_open_txt_file_with_trailing_comma(self):
+        """Test txt file with a trailing comma after last value."""
+        f = io.StringIO("400.0,500.0,600.0,\n")
+        result = open_txt_file(f)
+        expected = np.array([400.0, 500.0, 600.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
+
+    def test_open_txt_file_multiline(self):
+        """Test txt file with comma-terminated values on separate lines."""
+        f = io.StringIO("400.0,\n500.0,\n600.0\n")
+        result = open_txt_file(f)
+        expected = np.array([400.0, 500.0, 600.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
+
+    def test_open_txt_file_wrapped_with_spaces(self):
+        """Test txt file with spaced values wrapped across lines."""
+        f = io.StringIO("400.0, 500.0,\n 600.0")
+        result = open_txt_file(f)
+        expected = np.array([400.0, 500.0, 600.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
 
     def test_open_txt_file_many_values(self):
         """Test txt file with many wavelength values."""
         wavelengths = [400.0 + i * 10 for i in range(100)]
         csv_str = ",".join(str(w) for w in wavelengths)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write(csv_str)
-            temp_path = Path(f.name)
-
-        try:
-            result = open_txt_file(temp_path)
-            np.testing.assert_array_almost_equal(result, np.array(wavelengths))
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(csv_str)
+        result = open_txt_file(f)
+        self.assertEqual(result.shape, (len(wavelengths),))
+        self.assertTrue(
+            np.allclose(result, np.array(wavelengths), rtol=0, atol=1.5e-6)
+        )
+
+    def test_open_txt_file_float32(self):
+        """Test txt file parsed directly to float32."""
+        f = io.StringIO("400.0,450.5,500.0")
+        result = open_txt_file(f, dtype=np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        expected = np.array([400.0, 450.5, 500.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
 
     def test_open_txt_file_invalid_values(self):
         """Test txt file with non-numeric values raises ValueError."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("400.0,invalid,500.0")
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises(ValueError):
-                open_txt_file(temp_path)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO("400.0,invalid,500.0")
+        with self.assertRaises(ValueError):
+            open_txt_file(f)
 
     def test_open_txt_file_empty_file(self):
         """Test txt file that is empty."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises((ValueError, IndexError)):
-                open_txt_file(temp_path)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO()
+        with self.assertRaises((ValueError, IndexError)):
+            open_txt_file(f)
 
 
 class TestOpenCsvFile(unittest.TestCase):
     """Test cases for open_csv_file function."""
 
-    def test_open_csv_file_basic(self):
-        """Test opening a basic CSV file with wavelength column."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("wavelength,intensity\n")
-            f.write("400.0,100\n")
-            f.write("450.5,150\n")
-            f.write("500.0,200\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_csv_file(temp_path)
-            expected = np.array([400.0, 450.5, 500.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
     def test_open_csv_file_case_insensitive(self):
         """Test that wavelength column detection is case-insensitive."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("Wavelength,Value\n")
-            f.write("500.0,10\n")
-            f.write("600.0,20\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_csv_file(temp_path)
-            expected = np.array([500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "Wavelength,Value\n"
+            "500.0,10\n"
+            "600.0,20\n"
+        )
+        result = open_csv_file(f)
+        expected = np.array([500.0, 600.0])
+        np.testing.assert_array_almost_equal(result, expected)
 
     def test_open_csv_file_wavelength_not_first_column(self):
         """Test CSV where wavelength is not the first column."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("id,wavelength,intensity\n")
-            f.write("1,400.0,100\n")
-            f.write("2,500.0,200\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_csv_file(temp_path)
-            expected = np.array([400.0, 500.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "id,wavelength,intensity\n"
+            "1,400.0,100\n"
+            "2,500.0,200\n"
+        )
+        result = open_csv_file(f)
+        expected = np.array([400.0, 500.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
 
     def test_open_csv_file_no_wavelength_column(self):
         """Test CSV file without wavelength column raises ValueError."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("value,intensity\n")
-            f.write("100,50\n")
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises(ValueError):
-                open_csv_file(temp_path)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "value,intensity\n"
+            "100,50\n"
+        )
+        with self.assertRaises(ValueError):
+            open_csv_file(f)
 
     def test_open_csv_file_single_row(self):
         """Test CSV file with only header and one data row."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("wavelength,intensity\n")
-            f.write("550.0,100\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_csv_file(temp_path)
-            self.assertEqual(len(result), 1)
-            self.assertAlmostEqual(result[0], 550.0)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "wavelength,intensity\n"
+            "550.0,100\n"
+        )
+        result = open_csv_file(f)
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0], 550.0)
 
     def test_open_csv_file_many_columns(self):
         """Test CSV file with multiple columns."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("id,name,wavelength,intensity,quality\n")
-            f.write("1,band1,400.0,100,good\n")
-            f.write("2,band2,500.0,200,excellent\n")
-            f.write("3,band3,600.0,150,good\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_csv_file(temp_path)
-            expected = np.array([400.0, 500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "id,name,wavelength,intensity,quality\n"
+            "1,band1,400.0,100,good\n"
+            "2,band2,500.0,200,excellent\n"
+            "3,band3,600.0,150,good\n"
+        )
+        result = open_csv_file(f)
+        expected = np.array([400.0, 500.0, 600.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
 
 
 class TestOpenHdrFile(unittest.TestCase):
     """Test cases for open_hdr_file function."""
 
-    def test_open_hdr_file_basic(self):
-        """Test opening a basic ENVI .hdr file with wavelength field."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("samples = 100\n")
-            f.write("lines = 50\n")
-            f.write("bands = 5\n")
-            f.write("wavelength = {400.0, 450.0, 500.0, 550.0, 600.0}\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_hdr_file(temp_path)
-            expected = np.array([400.0, 450.0, 500.0, 550.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
     def test_open_hdr_file_with_spaces(self):
         """Test .hdr file with varying spacing in wavelength field."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("wavelength = {400.0 , 450.0 , 500.0}\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_hdr_file(temp_path)
-            expected = np.array([400.0, 450.0, 500.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "ENVI\n"
+            "wavelength = {400.0 , 450.0 , 500.0}\n"
+        )
+        result = open_hdr_file(f)
+        expected = np.array([400.0, 450.0, 500.0])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_open_hdr_file_multiline_wavelength(self):
+        """Test .hdr file whose wavelength block spans several lines."""
+        f = io.StringIO(
+            "ENVI\n"
+            "Wavelength = {\n"
+            " 400.0, 450.0,\n"
+            " 500.0}\n"
+        )
+        result = open_hdr_file(f)
+        expected = np.array([400.0, 450.0, 500.0])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
 
     def test_open_hdr_file_single_wavelength(self):
         """Test .hdr file with single wavelength value."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("wavelength = {550.0}\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_hdr_file(temp_path)
-            self.assertEqual(len(result), 1)
-            self.assertAlmostEqual(result[0], 550.0)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "ENVI\n"
+            "wavelength = {550.0}\n"
+        )
+        result = open_hdr_file(f)
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0], 550.0)
 
     def test_open_hdr_file_missing_wavelength_field(self):
         """Test .hdr file without wavelength field raises OSError."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("samples = 100\n")
-            f.write("lines = 50\n")
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises(OSError):
-                open_hdr_file(temp_path)
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "ENVI\n"
+            "samples = 100\n"
+            "lines = 50\n"
+        )
+        with self.assertRaises(OSError):
+            open_hdr_file(f)
 
     def test_open_hdr_file_many_wavelengths(self):
         """Test .hdr file with many wavelength values."""
         wavelengths = [400.0 + i * 5 for i in range(100)]
         wvl_str = ", ".join(str(w) for w in wavelengths)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write(f"wavelength = {{{wvl_str}}}\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_hdr_file(temp_path)
-            np.testing.assert_array_almost_equal(result, np.array(wavelengths))
-        finally:
-            temp_path.unlink()
+        f = io.StringIO(
+            "ENVI\n"
+            f"wavelength = {{{wvl_str}}}\n"
+        )
+        result = open_hdr_file(f)
+        self.assertEqual(result.shape, (len(wavelengths),))
+        self.assertTrue(
+            np.allclose(result, np.array(wavelengths), rtol=0, atol=1.5e-6)
+        )
 
     def test_open_hdr_file_with_other_fields(self):
         """Test .hdr file with other fields interspersed."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("description = {Test ENVI Header}\n")
-            f.write("samples = 512\n")
-            f.write("lines = 512\n")
-            f.write("bands = 224\n")
-            f.write("wavelength = {400.0, 401.79, 403.59, 405.39}\n")
-            f.write("data type = 4\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_hdr_file(temp_path)
-            expected = np.array([400.0, 401.79, 403.59, 405.39])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
-
-class TestOpenWvl(unittest.TestCase):
+        f = io.StringIO(
+            "ENVI\n"
+            "description = {Test ENVI Header}\n"
+            "samples = 512\n"
+            "lines = 512\n"
+            "bands = 224\n"
+            "wavelength = {400.0, 401.79, 403.59, 405.39}\n"
+            "data type = 4\n"
+        )
+        result = open_hdr_file(f)
+        expected = np.array([400.0, 401.79, 403.59, 405.39])
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, rtol=0, atol=1.5e-6))
+
+
+# ---- Basic parses shared through the session fixtures in conftest.py ----
+
+
+def test_open_txt_file_basic(basic_txt_array):
+    """Test opening a basic txt file with comma-separated wavelengths."""
+    expected = np.array([400.0, 450.5, 500.0, 550.5, 600.0])
+    assert basic_txt_array.shape == expected.shape
+    assert basic_txt_array.dtype == np.float64
+    np.testing.assert_array_almost_equal(basic_txt_array, expected)
+
+
+def test_open_csv_file_basic(basic_csv_array):
+    """Test opening a basic CSV file with wavelength column."""
+    expected = np.array([400.0, 450.5, 500.0])
+    assert basic_csv_array.shape == expected.shape
+    assert basic_csv_array.dtype == np.float64
+    np.testing.assert_array_almost_equal(basic_csv_array, expected)
+
+
+def test_open_hdr_file_basic(basic_hdr_array):
+    """Test opening a basic ENVI .hdr file with wavelength field."""
+    expected = np.array([400.0, 450.0, 500.0, 550.0, 600.0])
+    assert basic_hdr_array.shape == expected.shape
+    assert basic_hdr_array.dtype == np.float64
+    np.testing.assert_array_almost_equal(basic_hdr_array, expected)
+
+
+class TestReadEnviFields(unittest.TestCase):
+    """Test cases for the single-pass ENVI header field parser."""
+
+    def test_read_envi_fields(self):
+        """Test scalar and list fields are all read with lowercase names."""
+        f = io.StringIO(
+            "ENVI\n"
+            "description = {Test ENVI Header}\n"
+            "samples = 512\n"
+            "Lines = 256\n"
+            "bands = 3\n"
+            "wavelength = {400.0,\n 500.0, 600.0}\n"
+            "data type = 4\n"
+        )
+        fields = _read_envi_fields(f)
+        self.assertEqual(fields["description"], "Test ENVI Header")
+        self.assertEqual(fields["samples"], "512")
+        self.assertEqual(fields["lines"], "256")
+        self.assertEqual(fields["bands"], "3")
+        self.assertEqual(fields["wavelength"], "400.0,\n 500.0, 600.0")
+        self.assertEqual(fields["data type"], "4")
+        self.assertNotIn("envi", fields)
+
+
+def _wvl_file(suffix: str, content: str) -> pytest.MarkDecorator:
+    """Parametrizes a test's `wvl_file` fixture with one on-disk file."""
+    return pytest.mark.parametrize(
+        "wvl_file", [(suffix, content)], indirect=True, ids=[suffix]
+    )
+
+
+class TestOpenWvl:
     """Test cases for open_wvl dispatcher function."""
 
-    def test_open_wvl_txt_file(self):
+    @_wvl_file(".txt", "400.0,500.0,600.0")
+    def test_open_wvl_txt_file(self, wvl_file):
         """Test opening .txt file through dispatcher."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("400.0,500.0,600.0")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_wvl(temp_path)
-            expected = np.array([400.0, 500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
-    def test_open_wvl_csv_file(self):
+        result = open_wvl(wvl_file)
+        expected = np.array([400.0, 500.0, 600.0])
+        np.testing.assert_array_almost_equal(result, expected)
+
+    @_wvl_file(".csv", "wavelength,intensity\n500.0,100\n600.0,200\n")
+    def test_open_wvl_csv_file(self, wvl_file):
         """Test opening .csv file through dispatcher."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as f:
-            f.write("wavelength,intensity\n")
-            f.write("500.0,100\n")
-            f.write("600.0,200\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_wvl(temp_path)
-            expected = np.array([500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
-    def test_open_wvl_hdr_file(self):
+        result = open_wvl(wvl_file)
+        expected = np.array([500.0, 600.0])
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=0, atol=1.5e-6)
+
+    @_wvl_file(".hdr", "ENVI\nwavelength = {400.0, 500.0, 600.0}\n")
+    def test_open_wvl_hdr_file(self, wvl_file):
         """Test opening .hdr file through dispatcher."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".hdr", delete=False
-        ) as f:
-            f.write("ENVI\n")
-            f.write("wavelength = {400.0, 500.0, 600.0}\n")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_wvl(temp_path)
-            expected = np.array([400.0, 500.0, 600.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
-
-    def test_open_wvl_with_string_path(self):
+        result = open_wvl(wvl_file)
+        expected = np.array([400.0, 500.0, 600.0])
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=0, atol=1.5e-6)
+
+    @_wvl_file(".hdr", "")
+    def test_open_wvl_empty_hdr_file(self, wvl_file):
+        """Test an empty .hdr file on disk raises OSError."""
+        with pytest.raises(OSError):
+            open_wvl(wvl_file)
+
+    @_wvl_file(".txt", "550.0")
+    def test_open_wvl_with_string_path(self, wvl_file):
         """Test open_wvl accepts string path."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("550.0")
-            temp_path = f.name
-
-        try:
-            result = open_wvl(temp_path)
-            self.assertAlmostEqual(result[0], 550.0)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_open_wvl_with_path_object(self):
+        result = open_wvl(str(wvl_file))
+        assert result[0] == pytest.approx(550.0)
+
+    @_wvl_file(".txt", "550.0")
+    def test_open_wvl_with_path_object(self, wvl_file):
         """Test open_wvl accepts Path object."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("550.0")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_wvl(temp_path)
-            self.assertAlmostEqual(result[0], 550.0)
-        finally:
-            temp_path.unlink()
+        result = open_wvl(wvl_file)
+        assert result[0] == pytest.approx(550.0)
+
+    @_wvl_file(".txt", "400.0,500.0")
+    def test_open_wvl_dtype(self, wvl_file):
+        """Test open_wvl passes the requested dtype to the handler."""
+        assert open_wvl(wvl_file).dtype == np.float64
+        result = open_wvl(wvl_file, dtype=np.float32)
+        assert result.dtype == np.float32
+
+    @_wvl_file(".txt", "400.0,500.0")
+    def test_open_wvl_cache_returns_copy(self, wvl_file):
+        """Test modifying a returned array does not affect later opens."""
+        first = open_wvl(wvl_file)
+        first[0] = -1.0
+        second = open_wvl(wvl_file)
+        assert second.shape == (2,)
+        assert np.allclose(second, [400.0, 500.0], rtol=0, atol=1.5e-6)
+
+    @_wvl_file(".txt", "400.0,500.0")
+    def test_open_wvl_cache_invalidated_on_edit(self, wvl_file):
+        """Test a modified file is parsed again instead of served cached."""
+        open_wvl(wvl_file)
+        wvl_file.write_text("400.0,500.0,600.0")
+        stat = wvl_file.stat()
+        os.utime(wvl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        result = open_wvl(wvl_file)
+        assert result.shape == (3,)
+        assert np.allclose(result, [400.0, 500.0, 600.0], rtol=0, atol=1.5e-6)
 
     def test_open_wvl_file_not_found(self):
         """Test open_wvl raises FileNotFoundError for nonexistent file."""
         nonexistent_path = Path("/nonexistent/path/file.txt")
-        with self.assertRaises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError):
             open_wvl(nonexistent_path)
 
-    def test_open_wvl_unsupported_extension(self):
+    @_wvl_file(".xyz", "400.0")
+    def test_open_wvl_unsupported_extension(self, wvl_file):
         """Test open_wvl raises ValueError for unsupported file extension."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".xyz", delete=False
-        ) as f:
-            f.write("400.0")
-            temp_path = Path(f.name)
-
-        try:
-            with self.assertRaises(ValueError):
-                open_wvl(temp_path)
-        finally:
-            temp_path.unlink()
-
-    def test_open_wvl_case_insensitive_extension(self):
+        with pytest.raises(ValueError):
+            open_wvl(wvl_file)
+
+    @_wvl_file(".TXT", "400.0,500.0")
+    def test_open_wvl_case_insensitive_extension(self, wvl_file):
         """Test open_wvl handles uppercase file extensions."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".TXT", delete=False
-        ) as f:
-            f.write("400.0,500.0")
-            temp_path = Path(f.name)
-
-        try:
-            result = open_wvl(temp_path)
-            expected = np.array([400.0, 500.0])
-            np.testing.assert_array_almost_equal(result, expected)
-        finally:
-            temp_path.unlink()
+        result = open_wvl(wvl_file)
+        expected = np.array([400.0, 500.0])
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=0, atol=1.5e-6)
 
 
 if __name__ == "__main__":
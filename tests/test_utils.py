@@ -1,8 +1,12 @@
 """Unit tests for pycubeview.utils module."""
 
 import unittest
+import numpy as np
 from pycubeview.utils import (
     get_bresenham_line,
+    get_bresenham_line_tuples,
+    get_bresenham_lines,
+    spectra_mean_std,
     _low_bresenham_line,
     _high_bresenham_line,
 )
@@ -15,46 +19,46 @@ class TestBresenhamLine(unittest.TestCase):
         """Test low Bresenham line with horizontal line (slope ~0)."""
         pt1 = (0, 0)
         pt2 = (5, 0)
-        result = _low_bresenham_line(pt1, pt2)
+        xs, ys = _low_bresenham_line(pt1, pt2)
 
         # Should contain all points from start to end
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
-        self.assertEqual(len(result), 6)  # 6 points from (0,0) to (5,0)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
+        self.assertEqual(len(xs), 6)  # 6 points from (0,0) to (5,0)
 
     def test_low_bresenham_line_slight_positive_slope(self):
         """Test low Bresenham line with slight positive slope."""
         pt1 = (0, 0)
         pt2 = (4, 2)
-        result = _low_bresenham_line(pt1, pt2)
+        xs, ys = _low_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
         # Line should progress left to right
-        for i in range(len(result) - 1):
-            self.assertGreaterEqual(result[i + 1][0], result[i][0])
+        for i in range(len(xs) - 1):
+            self.assertGreaterEqual(xs[i + 1], xs[i])
 
     def test_high_bresenham_line_vertical(self):
         """Test high Bresenham line with vertical line (steep slope)."""
         pt1 = (0, 0)
         pt2 = (0, 5)
-        result = _high_bresenham_line(pt1, pt2)
+        xs, ys = _high_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
-        self.assertEqual(len(result), 6)  # 6 points from (0,0) to (0,5)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
+        self.assertEqual(len(xs), 6)  # 6 points from (0,0) to (0,5)
 
     def test_high_bresenham_line_steep_slope(self):
         """Test high Bresenham line with steep positive slope."""
         pt1 = (0, 0)
         pt2 = (2, 4)
-        result = _high_bresenham_line(pt1, pt2)
+        xs, ys = _high_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
         # Line should progress upward (y increases)
-        for i in range(len(result) - 1):
-            self.assertGreaterEqual(result[i + 1][1], result[i][1])
+        for i in range(len(ys) - 1):
+            self.assertGreaterEqual(ys[i + 1], ys[i])
 
     def test_get_bresenham_line_uses_low_for_gentle_slope(self):
         """
@@ -62,10 +66,10 @@ class TestBresenhamLine(unittest.TestCase):
         """
         pt1 = (0, 0)
         pt2 = (10, 3)
-        result = get_bresenham_line(pt1, pt2)
+        xs, ys = get_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
 
     def test_get_bresenham_line_uses_high_for_steep_slope(self):
         """
@@ -73,25 +77,33 @@ class TestBresenhamLine(unittest.TestCase):
         """
         pt1 = (0, 0)
         pt2 = (3, 10)
-        result = get_bresenham_line(pt1, pt2)
+        xs, ys = get_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
+
+    def test_get_bresenham_line_dtype(self):
+        """Test that get_bresenham_line returns int32 x and y arrays."""
+        xs, ys = get_bresenham_line((0, 0), (7, 3))
+
+        self.assertEqual(xs.dtype, np.int32)
+        self.assertEqual(ys.dtype, np.int32)
+        self.assertEqual(xs.shape, ys.shape)
 
     def test_bresenham_line_negative_direction(self):
         """Test Bresenham line working in reverse direction."""
         pt1 = (5, 5)
         pt2 = (0, 0)
-        result = get_bresenham_line(pt1, pt2)
+        xs, ys = get_bresenham_line(pt1, pt2)
 
-        self.assertEqual(result[0], pt1)
-        self.assertEqual(result[-1], pt2)
+        self.assertEqual((xs[0], ys[0]), pt1)
+        self.assertEqual((xs[-1], ys[-1]), pt2)
 
     def test_bresenham_line_single_point(self):
         """Test Bresenham line with start and end at same point."""
         pt1 = (3, 3)
         pt2 = (3, 3)
-        result = get_bresenham_line(pt1, pt2)
+        result = get_bresenham_line_tuples(pt1, pt2)
 
         self.assertEqual(result, [(3, 3)])
 
@@ -99,7 +111,7 @@ class TestBresenhamLine(unittest.TestCase):
         """Test Bresenham line with perfect diagonal."""
         pt1 = (0, 0)
         pt2 = (5, 5)
-        result = get_bresenham_line(pt1, pt2)
+        result = get_bresenham_line_tuples(pt1, pt2)
 
         self.assertEqual(result[0], pt1)
         self.assertEqual(result[-1], pt2)
@@ -107,5 +119,74 @@ class TestBresenhamLine(unittest.TestCase):
         self.assertTrue(len(result) >= 6)
 
 
+class TestBresenhamLines(unittest.TestCase):
+    """Test cases for the batched get_bresenham_lines kernel."""
+
+    def test_matches_single_segments(self):
+        """Test batched output equals concatenated single-segment lines."""
+        segs = np.array(
+            [
+                [[0, 0], [5, 2]],
+                [[5, 2], [3, 9]],
+                [[3, 9], [-4, -1]],
+            ]
+        )
+        result = get_bresenham_lines(segs)
+
+        expected = []
+        for (x0, y0), (x1, y1) in segs.tolist():
+            expected.extend(get_bresenham_line_tuples((x0, y0), (x1, y1)))
+
+        self.assertEqual(result.dtype, np.int32)
+        self.assertEqual([tuple(i) for i in result.tolist()], expected)
+
+    def test_no_segments(self):
+        """Test an empty segment array gives an empty pixel array."""
+        result = get_bresenham_lines(np.empty((0, 2, 2), dtype=np.int64))
+        self.assertEqual(result.shape, (0, 2))
+
+
+class TestSpectraMeanStd(unittest.TestCase):
+    """Test cases for the spectra_mean_std reduction."""
+
+    def test_matches_numpy(self):
+        """Test mean and ddof=1 std agree with NumPy."""
+        spectra = np.random.default_rng(0).random((25, 40))
+        mean, std = spectra_mean_std(spectra)
+        np.testing.assert_allclose(mean, spectra.mean(axis=0))
+        np.testing.assert_allclose(std, spectra.std(axis=0, ddof=1))
+
+    def test_integer_input(self):
+        """Test integer spectra give untruncated float64 results."""
+        rng = np.random.default_rng(0)
+        spectra = rng.integers(0, 1000, (10, 4)).astype(np.uint16)
+        mean, std = spectra_mean_std(spectra)
+        self.assertEqual(mean.dtype, np.float64)
+        self.assertEqual(std.dtype, np.float64)
+        np.testing.assert_allclose(mean, spectra.mean(axis=0))
+        np.testing.assert_allclose(std, spectra.std(axis=0, ddof=1))
+
+    def test_float16_input(self):
+        """Test float16 spectra are accepted."""
+        spectra = np.arange(12, dtype=np.float16).reshape(4, 3)
+        mean, std = spectra_mean_std(spectra)
+        np.testing.assert_allclose(mean, [4.5, 5.5, 6.5])
+        np.testing.assert_allclose(std, spectra.std(axis=0, ddof=1), 1e-3)
+
+    def test_nan_propagates(self):
+        """Test a NaN pixel gives a NaN mean for that band only."""
+        spectra = np.ones((4, 3), dtype=np.float32)
+        spectra[1, 2] = np.nan
+        mean, std = spectra_mean_std(spectra)
+        self.assertEqual(mean.dtype, np.float32)
+        np.testing.assert_array_equal(np.isnan(mean), [False, False, True])
+
+    def test_single_spectrum(self):
+        """Test a single spectrum has an undefined (NaN) std."""
+        mean, std = spectra_mean_std(np.arange(3.0)[None, :])
+        np.testing.assert_array_equal(mean, [0.0, 1.0, 2.0])
+        self.assertTrue(np.all(np.isnan(std)))
+
+
 if __name__ == "__main__":
     unittest.main()